@@ -104,6 +104,83 @@ def compute_metrics(hist):
     average_volume = float(np.mean(volumes)) if len(volumes) > 0 else 0.0
     return {"volatility": volatility, "trend": trend, "average_volume": average_volume}
 
+# -----------------------------
+# Calcul vectorisé des métriques pour plusieurs tickers à la fois
+# -----------------------------
+def pad_ragged_rows(rows):
+    """
+    Aligne à gauche une liste de séries de longueurs différentes dans un tableau 2-D
+    complété par des NaN. Retourne le tableau et la longueur utile de chaque ligne.
+    """
+    lengths = np.array([len(row) for row in rows], dtype=int)
+    width = max(1, int(lengths.max())) if len(rows) > 0 else 1
+    padded = np.full((len(rows), width), np.nan)
+    mask = np.arange(width) < lengths[:, None]
+    if mask.any():
+        padded[mask] = np.concatenate(rows)
+    return padded, lengths
+
+def compute_metrics_batch(series_by_ticker):
+    """
+    Calcule en une seule passe vectorisée la volatilité, la tendance et le volume moyen
+    pour plusieurs tickers. `series_by_ticker` associe à chaque ticker un couple
+    (prix de clôture, volumes). Les valeurs manquantes sont ignorées et chaque ligne
+    donne le même résultat que compute_metrics : 0.0 en dessous de deux cotations,
+    et une volatilité nan si un prix est nul ou négatif.
+    """
+    tickers = list(series_by_ticker)
+    if not tickers:
+        return {}
+
+    closes_rows = []
+    volumes_rows = []
+    for ticker in tickers:
+        closes, volumes = series_by_ticker[ticker]
+        closes = np.asarray(closes, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+        closes_rows.append(closes[~np.isnan(closes)])
+        volumes_rows.append(volumes[~np.isnan(volumes)])
+
+    closes, n_closes = pad_ragged_rows(closes_rows)
+    volumes, n_volumes = pad_ragged_rows(volumes_rows)
+    positions = np.arange(closes.shape[1])
+    close_mask = positions < n_closes[:, None]
+    has_history = n_closes >= 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Volatilité : écart-type des rendements logarithmiques sur les positions valides
+        log_returns = np.diff(np.log(closes), axis=1)
+        return_mask = positions[:-1] < (n_closes - 1)[:, None]
+        n_returns = return_mask.sum(axis=1)
+        mean_returns = np.where(return_mask, log_returns, 0.0).sum(axis=1) / n_returns
+        deviations = np.where(return_mask, log_returns - mean_returns[:, None], 0.0)
+        volatility = np.sqrt((deviations ** 2).sum(axis=1) / n_returns)
+
+        # Tendance : pente des moindres carrés (équivalente à np.polyfit de degré 1)
+        mean_x = np.where(close_mask, positions, 0).sum(axis=1) / n_closes
+        mean_y = np.where(close_mask, closes, 0.0).sum(axis=1) / n_closes
+        dx = np.where(close_mask, positions - mean_x[:, None], 0.0)
+        dy = np.where(close_mask, closes - mean_y[:, None], 0.0)
+        trend = (dx * dy).sum(axis=1) / (dx ** 2).sum(axis=1)
+
+        # Volume moyen
+        volume_mask = np.arange(volumes.shape[1]) < n_volumes[:, None]
+        average_volume = np.where(volume_mask, volumes, 0.0).sum(axis=1) / n_volumes
+
+    # Moins de deux cotations : 0.0, comme dans compute_metrics
+    volatility = np.where(has_history, volatility, 0.0)
+    trend = np.where(has_history, trend, 0.0)
+    average_volume = np.where(n_volumes > 0, average_volume, 0.0)
+
+    return {
+        ticker: {
+            "volatility": float(volatility[i]),
+            "trend": float(trend[i]),
+            "average_volume": float(average_volume[i])
+        }
+        for i, ticker in enumerate(tickers)
+    }
+
 # -----------------------------
 # Récupération des données boursières pour un ticker sur une période donnée
 # -----------------------------
@@ -156,20 +233,26 @@ def generate_sql_select(ticker):
     )
     return sql
 
+def get_db_connection():
+    """
+    Ouvre une connexion à la base de données MariaDB du conteneur Docker.
+    """
+    # Paramètres de connexion à la base de données dans un conteneur Docker
+    return mariadb.connect(
+        host='127.0.0.1',          # Nom du service Docker ou l'adresse IP du conteneur
+        port=3306,                # Port par défaut pour MariaDB
+        user='nifi_user',         # Nom d'utilisateur de la base de données
+        password='nifi_password', # Mot de passe de la base de données
+        database='AMB'            # Nom de la base de données
+    )
+
 def execute_sql_query(sql_query):
     """
     Se connecte à la base de données MariaDB et exécute la requête SQL fournie.
     """
     connection = None  # Initialisation de la variable
     try:
-        # Paramètres de connexion à la base de données dans un conteneur Docker
-        connection = mariadb.connect(
-            host='127.0.0.1',          # Nom du service Docker ou l'adresse IP du conteneur
-            port=3306,                # Port par défaut pour MariaDB
-            user='nifi_user',         # Nom d'utilisateur de la base de données
-            password='nifi_password', # Mot de passe de la base de données
-            database='AMB'            # Nom de la base de données
-        )
+        connection = get_db_connection()
 
         print("Connexion réussie à la base de données")
 
@@ -195,6 +278,76 @@ def execute_sql_query(sql_query):
             connection.close()
             print("\nConnexion à la base de données fermée")
 
+# -----------------------------
+# Analyse d'une watchlist complète à partir de la base de données
+# -----------------------------
+def fetch_watchlist_history(tickers, window=30):
+    """
+    Récupère en une seule requête les prix de clôture et volumes des trois derniers mois
+    pour tous les tickers de la watchlist, puis conserve les `window` dernières cotations
+    de chacun. Retourne un dictionnaire ticker -> (prix de clôture, volumes),
+    ou None si la base de données n'a pas pu être interrogée.
+    """
+    history = {ticker: ([], []) for ticker in tickers}
+    if not tickers:
+        return history
+
+    placeholders = ", ".join(["?"] * len(tickers))
+    sql = (
+        f"SELECT ticker, close_price, volume FROM financial_data "
+        f"WHERE ticker IN ({placeholders}) "
+        f"AND date >= DATE_SUB(CURDATE(), INTERVAL 3 MONTH) "
+        f"ORDER BY ticker, date;"
+    )
+
+    connection = None
+    try:
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        cursor.execute(sql, tuple(tickers))
+        for ticker, close_price, volume in cursor.fetchall():
+            # La comparaison SQL ignore la casse : on fait de même côté Python
+            ticker = ticker.upper()
+            if ticker not in history:
+                continue
+            closes, volumes = history[ticker]
+            closes.append(np.nan if close_price is None else float(close_price))
+            volumes.append(np.nan if volume is None else float(volume))
+    except mariadb.Error as e:
+        print("Erreur lors de la récupération de la watchlist :", e)
+        return None
+    finally:
+        if connection is not None:
+            connection.close()
+
+    return {
+        ticker: (closes[-window:], volumes[-window:])
+        for ticker, (closes, volumes) in history.items()
+    }
+
+def screen_watchlist(tickers, window=30):
+    """
+    Calcule la volatilité, la tendance et le volume moyen de toute une watchlist
+    à partir des données stockées dans MariaDB, sans appel réseau par ticker.
+    Les tickers absents de la base sont associés à None. Retourne None si la base
+    de données n'a pas pu être interrogée.
+    """
+    seen = set()
+    unique_tickers = []
+    for ticker in tickers:
+        ticker = ticker.strip().upper()
+        if ticker and ticker not in seen:
+            seen.add(ticker)
+            unique_tickers.append(ticker)
+
+    history = fetch_watchlist_history(unique_tickers, window=window)
+    if history is None:
+        return None
+
+    with_data = {ticker: series for ticker, series in history.items() if len(series[0]) > 0}
+    metrics = compute_metrics_batch(with_data)
+    return {ticker: metrics.get(ticker) for ticker in unique_tickers}
+
 def get_keywords_from_question(question):
     """
     Transforme la question en une liste de mots-clés pour rechercher des articles d'actualité.
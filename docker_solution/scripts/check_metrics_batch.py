@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import LLM_v2
+
+# -----------------------------
+# Vérification de compute_metrics_batch par rapport à compute_metrics
+# -----------------------------
+def build_cases():
+    """
+    Construit des séries (prix de clôture, volumes) couvrant les cas limites :
+    séries vides, à un ou deux points, séries de longueurs différentes avec des
+    trous (NaN) et séries contenant un prix nul ou négatif.
+    """
+    rng = np.random.default_rng(0)
+    cases = {
+        "VIDE": ([], []),
+        "UN_POINT": ([100.0], [1000.0]),
+        "DEUX_POINTS": ([100.0, 102.0], [1000.0, 1500.0]),
+        "NAN_SEUL": ([np.nan, 101.0], [np.nan, 2000.0]),
+        "PRIX_NUL": ([10.0, 0.0, 12.0], [1.0, 2.0, 3.0]),
+        "PRIX_NEGATIF": ([10.0, -2.0, 12.0], [1.0, 2.0, 3.0]),
+    }
+    for i in range(50):
+        n = int(rng.integers(3, 60))
+        closes = rng.uniform(10, 500, n)
+        volumes = rng.uniform(1e3, 1e7, n)
+        gaps = rng.random(n) < 0.1
+        closes[gaps] = np.nan
+        volumes[rng.random(n) < 0.1] = np.nan
+        cases[f"ALEA_{i}"] = (closes, volumes)
+    return cases
+
+def check_compute_metrics_batch():
+    """
+    Compare, ticker par ticker, les résultats de compute_metrics_batch avec ceux
+    de compute_metrics et retourne la liste des tickers en écart.
+    """
+    cases = build_cases()
+    batch = LLM_v2.compute_metrics_batch(cases)
+    mismatches = []
+    for ticker, (closes, volumes) in cases.items():
+        hist = pd.DataFrame({"Close": closes, "Volume": volumes}, dtype=float)
+        # Les prix nuls ou négatifs produisent volontairement des avertissements numpy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            expected = LLM_v2.compute_metrics(hist)
+        for key in ("volatility", "trend", "average_volume"):
+            if not np.isclose(batch[ticker][key], expected[key], equal_nan=True):
+                mismatches.append((ticker, key, batch[ticker][key], expected[key]))
+    return len(cases), mismatches
+
+if __name__ == "__main__":
+    n_cases, mismatches = check_compute_metrics_batch()
+    if mismatches:
+        print("Écarts entre compute_metrics_batch et compute_metrics :")
+        for ticker, key, got, expected in mismatches:
+            print(f"  {ticker} / {key} : {got} au lieu de {expected}")
+        raise SystemExit(1)
+    print(f"compute_metrics_batch identique à compute_metrics sur {n_cases} séries.")
@@ -26,7 +26,7 @@ class App(tk.Tk):
         container.grid_columnconfigure(0, weight=1)
 
         self.frames = {}
-        for PageClass in (PageOne, PageTwo):
+        for PageClass in (PageOne, PageTwo, PageThree):
             page = PageClass(parent=container, controller=self)
             self.frames[PageClass] = page
             page.grid(row=0, column=0, sticky="nsew")
@@ -64,6 +64,10 @@ class PageOne(tk.Frame):
                                   command=lambda: controller.show_frame(PageTwo))
         button_to_rss.pack(pady=5)
 
+        button_to_watchlist = tk.Button(self, text="Analyser une watchlist",
+                                        command=lambda: controller.show_frame(PageThree))
+        button_to_watchlist.pack(pady=5)
+
         self.chart_frame = tk.Frame(self)
         self.chart_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -239,6 +243,61 @@ class PageTwo(tk.Frame):
         else:
             self.article_display.config(text="Index hors limites.")
 
+class PageThree(tk.Frame):
+    """
+    Page 3 : Analyse d'une watchlist.
+    Calcule en une seule passe la volatilité, la tendance et le volume moyen
+    de tous les tickers saisis, à partir des données stockées dans MariaDB.
+    """
+    def __init__(self, parent, controller):
+        super().__init__(parent)
+        self.controller = controller
+
+        label_watchlist = tk.Label(self, text="Tickers de la watchlist (séparés par des virgules ou des espaces) :")
+        label_watchlist.pack(pady=5)
+        self.entry_watchlist = tk.Entry(self, width=70)
+        self.entry_watchlist.pack(pady=5)
+
+        button_screen = tk.Button(self, text="Analyser la watchlist", command=self.analyser_watchlist)
+        button_screen.pack(pady=5)
+
+        self.results_text = tk.Text(self, font=("Courier", 9), height=25)
+        self.results_text.pack(fill="both", expand=True, padx=10, pady=5)
+
+        button_back = tk.Button(self, text="Retour à l'accueil",
+                                command=lambda: controller.show_frame(PageOne))
+        button_back.pack(pady=5)
+
+    def analyser_watchlist(self):
+        tickers = self.entry_watchlist.get().replace(",", " ").split()
+        if not tickers:
+            messagebox.showwarning("Entrée invalide", "Veuillez entrer au moins un ticker.")
+            return
+
+        metrics = LLM_v2.screen_watchlist(tickers)
+        if metrics is None:
+            messagebox.showerror("Erreur", "Impossible de récupérer les données de la watchlist depuis la base de données.")
+            return
+
+        lines = [f"{'Ticker':<10}{'Volatilité':>14}{'Tendance':>14}{'Volume moyen':>18}"]
+        for ticker, values in metrics.items():
+            if values is None:
+                lines.append(f"{ticker:<10}{'aucune donnée':>14}")
+                continue
+            lines.append(
+                f"{ticker:<10}"
+                f"{values['volatility']:>14.4f}"
+                f"{values['trend']:>14.4f}"
+                f"{values['average_volume']:>18.0f}"
+            )
+        self.results_text.delete("1.0", tk.END)
+        self.results_text.insert(tk.END, "\n".join(lines))
+
+        sans_donnees = [ticker for ticker, values in metrics.items() if values is None]
+        if sans_donnees:
+            messagebox.showinfo("Données manquantes",
+                                f"Aucune donnée disponible pour : {', '.join(sans_donnees)}")
+
 if __name__ == "__main__":
     app = App()
     app.mainloop()